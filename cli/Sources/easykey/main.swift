@@ -184,8 +184,46 @@ struct KeychainManager {
         try updateLastAccess(context: context)
     }
 
+    /// Authenticate once for a long-lived session. The returned context can be passed to the
+    /// `context:` variants below so later operations do not prompt again.
+    func openSession(reason: String) throws -> LAContext? {
+        return try authenticate(reason: reason)
+    }
+
     func getSecret(name: String, reason: String) throws -> Data {
+        return try getSecret(name: name, context: try authenticate(reason: reason))
+    }
+
+    func getSecret(name: String, context: LAContext?) throws -> Data {
+        let data = try readSecret(name: name, context: context)
+        try updateLastAccess(context: context)
+        return data
+    }
+
+    /// Read several secrets behind a single authentication prompt.
+    func getSecrets(names: [String], reason: String) throws -> [(name: String, value: Data)] {
+        let context = try authenticate(reason: reason)
+        let values = try names.map { name -> (name: String, value: Data) in
+            let data = try readSecret(name: name, context: context)
+            return (name: name, value: data)
+        }
+        try updateLastAccess(context: context)
+        return values
+    }
+
+    /// Read secrets named by `nextName` until it returns nil, behind a single authentication
+    /// prompt, handing each one to `emit` as soon as it has been read.
+    func streamSecrets(reason: String, nextName: () -> String?, emit: (String, Data) throws -> Void) throws {
         let context = try authenticate(reason: reason)
+        while let name = nextName() {
+            if name.isEmpty { continue }
+            let data = try readSecret(name: name, context: context)
+            try emit(name, data)
+        }
+        try updateLastAccess(context: context)
+    }
+
+    private func readSecret(name: String, context: LAContext?) throws -> Data {
         var query: [String: Any] = [
             kSecClass as String: kSecClassGenericPassword,
             kSecAttrService as String: serviceName,
@@ -204,7 +242,6 @@ struct KeychainManager {
         guard status == errSecSuccess, let data = item as? Data else {
             throw CLIError.keychain("Read failed (\(status))")
         }
-        try updateLastAccess(context: context)
         return data
     }
 
@@ -273,7 +310,10 @@ struct KeychainManager {
     }
 
     func listSecrets(reason: String) throws -> [(name: String, createdAt: Date?)] {
-        let context = try authenticate(reason: reason)
+        return try listSecrets(context: try authenticate(reason: reason))
+    }
+
+    func listSecrets(context: LAContext?) throws -> [(name: String, createdAt: Date?)] {
         var query: [String: Any] = [
             kSecClass as String: kSecClassGenericPassword,
             kSecAttrService as String: serviceName,
@@ -301,7 +341,10 @@ struct KeychainManager {
     }
 
     func status(reason: String) throws -> (count: Int, lastAccess: Date?) {
-        let context = try authenticate(reason: reason)
+        return try status(context: try authenticate(reason: reason))
+    }
+
+    func status(context: LAContext?) throws -> (count: Int, lastAccess: Date?) {
         // Count secrets
         var query: [String: Any] = [
             kSecClass as String: kSecClassGenericPassword,
@@ -432,12 +475,15 @@ struct KeychainManager {
 
 enum Command {
     case get(name: String, quiet: Bool)
+    case getBatch(names: [String])
+    case getStream
     case set(name: String, value: String)
     case remove(name: String)
-    case list(json: Bool)
-    case status
-    case cleanup
+    case list(json: Bool, jsonLines: Bool)
+    case status(json: Bool)
+    case cleanup(confirmed: Bool, json: Bool)
     case uninstall
+    case server
     case help
     case version
 }
@@ -456,25 +502,35 @@ private func printUsage() {
       --reason "text"       Optional reason for audit logging
       --help                Show this help
       --version             Show CLI version
+      --stdio-server        Serve newline-delimited JSON requests on stdin until EOF
 
     Commands:
       get <SECRET_NAME> [--reason "text"] [--quiet]
         Retrieve a secret. Triggers biometric if locked. Prints plaintext to stdout.
 
+      get --batch <SECRET_NAME>... [--reason "text"]
+        Retrieve several secrets at once. Prints a JSON object mapping names to values.
+
+      get --batch --stdin [--reason "text"]
+        Read secret names from stdin, one per line, and print one {"name", "value"}
+        JSON object per line as each secret is read. Pairs with `easykey list`.
+
       set <SECRET_NAME> <SECRET_VALUE> [--reason "text"]
         Store a new secret or update existing. Biometric confirmation required.
 
       remove <SECRET_NAME> [--reason "text"]
         Delete a secret. Biometric confirmation required.
 
-      list [--json] [--verbose]
+      list [--json | --jsonl] [--verbose]
         Show stored secret names only. With --verbose, include creation timestamps.
+        With --jsonl, print one JSON object per secret per line.
 
-      status
+      status [--json]
         Show vault status: number of secrets and last access timestamp.
 
-      cleanup
+      cleanup [--yes] [--json]
         Remove all easykey secrets from keychain (nuclear option for fixing access issues).
+        With --yes, skip the interactive confirmation. With --yes --json, print {"removed": N}.
 
       uninstall
         Remove the EasyKey app from /Applications. Secrets remain in keychain.
@@ -486,7 +542,12 @@ private func parseCLI() throws -> (Command, CLIOptions) {
     var args = Array(CommandLine.arguments.dropFirst())
     var options = CLIOptions()
     var jsonFlag = false
+    var jsonLinesFlag = false
     var quietFlag = false
+    var batchFlag = false
+    var stdinFlag = false
+    var serverFlag = false
+    var yesFlag = false
 
     // Extract global flags first (order-agnostic)
     var i = 0
@@ -510,20 +571,54 @@ private func parseCLI() throws -> (Command, CLIOptions) {
             args.remove(at: i)
             continue
         }
+        if arg == "--jsonl" {
+            jsonLinesFlag = true
+            args.remove(at: i)
+            continue
+        }
         if arg == "--quiet" {
             quietFlag = true
             args.remove(at: i)
             continue
         }
+        if arg == "--stdio-server" {
+            serverFlag = true
+            args.remove(at: i)
+            continue
+        }
+        if arg == "--yes" {
+            yesFlag = true
+            args.remove(at: i)
+            continue
+        }
+        if arg == "--stdin" {
+            stdinFlag = true
+            args.remove(at: i)
+            continue
+        }
+        if arg == "--batch" {
+            batchFlag = true
+            args.remove(at: i)
+            continue
+        }
         i += 1
     }
 
+    if serverFlag { return (.server, options) }
+
     guard let cmd = args.first else {
         throw CLIError.invalidArguments("Missing command. Use --help for usage.")
     }
 
     switch cmd.lowercased() {
     case "get":
+        if batchFlag && stdinFlag {
+            return (.getStream, options)
+        }
+        if batchFlag {
+            guard args.count >= 2 else { throw CLIError.invalidArguments("Usage: easykey get --batch <SECRET_NAME>... [--reason \"text\"]") }
+            return (.getBatch(names: Array(args.dropFirst())), options)
+        }
         guard args.count >= 2 else { throw CLIError.invalidArguments("Usage: easykey get <SECRET_NAME> [--reason \"text\"] [--quiet]") }
         let name = args[1]
         return (.get(name: name, quiet: quietFlag), options)
@@ -537,11 +632,14 @@ private func parseCLI() throws -> (Command, CLIOptions) {
         let name = args[1]
         return (.remove(name: name), options)
     case "list":
-        return (.list(json: jsonFlag), options)
+        return (.list(json: jsonFlag, jsonLines: jsonLinesFlag), options)
     case "status":
-        return (.status, options)
+        return (.status(json: jsonFlag), options)
     case "cleanup":
-        return (.cleanup, options)
+        if jsonFlag && !yesFlag {
+            throw CLIError.invalidArguments("cleanup --json requires --yes (the interactive prompt is not JSON)")
+        }
+        return (.cleanup(confirmed: yesFlag, json: jsonFlag), options)
     case "uninstall":
         return (.uninstall, options)
     case "--help", "help":
@@ -551,6 +649,91 @@ private func parseCLI() throws -> (Command, CLIOptions) {
     }
 }
 
+// MARK: - JSON Output
+
+/// Vault status as a JSON object; last_access is null when never accessed.
+private func statusPayload(_ state: (count: Int, lastAccess: Date?)) -> [String: Any] {
+    return [
+        "secrets": state.count,
+        "last_access": state.lastAccess.map { format(date: $0) as Any } ?? NSNull()
+    ]
+}
+
+// MARK: - Stdio Server
+
+/// Handle one server request and return its JSON-serializable result.
+private func handleServerRequest(op: String, request: [String: Any], context: LAContext?, kc: KeychainManager) throws -> Any {
+    switch op {
+    case "get":
+        guard let name = request["name"] as? String else { throw CLIError.invalidArguments("get requires a name") }
+        let data = try kc.getSecret(name: name, context: context)
+        guard let text = String(data: data, encoding: .utf8) else {
+            throw CLIError.keychain("Secret is not valid UTF-8: \(name)")
+        }
+        return text
+    case "list":
+        return try kc.listSecrets(context: context).map { entry -> [String: Any] in
+            var item: [String: Any] = ["name": entry.name]
+            if let createdAt = entry.createdAt { item["createdAt"] = format(date: createdAt) }
+            return item
+        }
+    case "status":
+        return statusPayload(try kc.status(context: context))
+    default:
+        throw CLIError.invalidArguments("Unknown op: \(op)")
+    }
+}
+
+/// How long one server authentication may be reused before prompting again.
+private let serverSessionTTL: TimeInterval = 300
+
+/// An authentication context shared by consecutive server requests.
+private struct ServerSession {
+    let context: LAContext?
+    let reason: String
+    let started: Date
+}
+
+/// Read one JSON request per line from stdin and write one JSON reply per line to stdout.
+/// Replies are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+/// A request reuses the previous authentication only if it gives the same reason and the
+/// session is younger than `serverSessionTTL`; otherwise the user is prompted again.
+private func runStdioServer(kc: KeychainManager, options: CLIOptions) {
+    var session: ServerSession?
+    while let line = readLine() {
+        if line.trimmingCharacters(in: .whitespaces).isEmpty { continue }
+        var reply: [String: Any]
+        do {
+            guard let request = try JSONSerialization.jsonObject(with: Data(line.utf8)) as? [String: Any],
+                  let op = request["op"] as? String else {
+                throw CLIError.invalidArguments("Malformed request")
+            }
+            if options.verbose { eprint("[debug] server op=\(op)") }
+            let reason = request["reason"] as? String ?? options.reason
+            if let current = session,
+               current.reason == reason,
+               Date().timeIntervalSince(current.started) < serverSessionTTL {
+                if options.verbose { eprint("[debug] reusing server session") }
+            } else {
+                session = nil
+                session = ServerSession(context: try kc.openSession(reason: reason), reason: reason, started: Date())
+            }
+            let result = try handleServerRequest(op: op, request: request, context: session?.context, kc: kc)
+            reply = ["ok": true, "result": result]
+        } catch let err as CLIError {
+            reply = ["ok": false, "error": err.description]
+        } catch {
+            reply = ["ok": false, "error": error.localizedDescription]
+        }
+        guard let data = try? JSONSerialization.data(withJSONObject: reply, options: [.withoutEscapingSlashes]) else {
+            eprint("error: failed to encode server reply")
+            exit(1)
+        }
+        FileHandle.standardOutput.write(data)
+        FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+    }
+}
+
 // MARK: - Main
 
 do {
@@ -579,18 +762,52 @@ do {
             FileHandle.standardOutput.write("\n".data(using: .utf8)!)
         }
         if options.verbose && !quiet { eprint("[debug] get: success") }
+    case .getBatch(let names):
+        if options.verbose { eprint("[debug] get batch count=\(names.count) reason=\(options.reason)") }
+        var values: [String: String] = [:]
+        for (name, data) in try kc.getSecrets(names: names, reason: options.reason) {
+            guard let text = String(data: data, encoding: .utf8) else {
+                throw CLIError.keychain("Secret is not valid UTF-8: \(name)")
+            }
+            values[name] = text
+        }
+        let encoder = JSONEncoder()
+        encoder.outputFormatting = [.withoutEscapingSlashes]
+        FileHandle.standardOutput.write(try encoder.encode(values))
+        FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+        if options.verbose { eprint("[debug] get batch: success") }
+    case .getStream:
+        if options.verbose { eprint("[debug] get stream reason=\(options.reason)") }
+        struct JsonSecret: Codable { let name: String; let value: String }
+        let encoder = JSONEncoder()
+        encoder.outputFormatting = [.withoutEscapingSlashes]
+        try kc.streamSecrets(reason: options.reason, nextName: { readLine() }, emit: { name, data in
+            guard let text = String(data: data, encoding: .utf8) else {
+                throw CLIError.keychain("Secret is not valid UTF-8: \(name)")
+            }
+            FileHandle.standardOutput.write(try encoder.encode(JsonSecret(name: name, value: text)))
+            FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+        })
+        if options.verbose { eprint("[debug] get stream: success") }
     case .remove(let name):
         if options.verbose { eprint("[debug] remove name=\(name) reason=\(options.reason)") }
         try kc.removeSecret(name: name, reason: options.reason)
         if options.verbose { eprint("[debug] remove: success") }
-    case .list(let json):
+    case .list(let json, let jsonLines):
         if options.verbose { eprint("[debug] list reason=\(options.reason)") }
         let items = try kc.listSecrets(reason: options.reason)
-        if json {
-            struct JsonEntry: Codable { let name: String; let createdAt: String? }
+        struct JsonEntry: Codable { let name: String; let createdAt: String? }
+        let payload = items.map { JsonEntry(name: $0.name, createdAt: $0.createdAt.map { format(date: $0) }) }
+        if jsonLines {
+            let encoder = JSONEncoder()
+            encoder.outputFormatting = [.withoutEscapingSlashes]
+            for entry in payload {
+                FileHandle.standardOutput.write(try encoder.encode(entry))
+                FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+            }
+        } else if json {
             let encoder = JSONEncoder()
             encoder.outputFormatting = [.prettyPrinted, .withoutEscapingSlashes]
-            let payload = items.map { JsonEntry(name: $0.name, createdAt: $0.createdAt.map { format(date: $0) }) }
             let data = try encoder.encode(payload)
             FileHandle.standardOutput.write(data)
             FileHandle.standardOutput.write("\n".data(using: .utf8)!)
@@ -604,26 +821,44 @@ do {
             }
         }
         if options.verbose { eprint("[debug] list: success (\(items.count) items)") }
-    case .status:
+    case .status(let json):
         if options.verbose { eprint("[debug] status reason=\(options.reason)") }
         let state = try kc.status(reason: options.reason)
-        print("secrets: \(state.count)")
-        print("last_access: \(state.lastAccess.map { format(date: $0) } ?? "-")")
+        if json {
+            let data = try JSONSerialization.data(withJSONObject: statusPayload(state), options: [.withoutEscapingSlashes])
+            FileHandle.standardOutput.write(data)
+            FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+        } else {
+            print("secrets: \(state.count)")
+            print("last_access: \(state.lastAccess.map { format(date: $0) } ?? "-")")
+        }
         if options.verbose { eprint("[debug] status: success") }
-    case .cleanup:
+    case .cleanup(let confirmed, let json):
         if options.verbose { eprint("[debug] cleanup reason=\(options.reason)") }
-        print("WARNING: This will delete ALL easykey secrets from the keychain!")
-        print("This cannot be undone. Continue? (type 'yes' to confirm)")
-        
-        let input = readLine() ?? ""
-        if input.lowercased() == "yes" {
+        var proceed = confirmed
+        if !proceed {
+            print("WARNING: This will delete ALL easykey secrets from the keychain!")
+            print("This cannot be undone. Continue? (type 'yes' to confirm)")
+            proceed = (readLine() ?? "").lowercased() == "yes"
+        }
+        if proceed {
             let deletedCount = try kc.cleanupAllSecrets(reason: options.reason)
-            print("Cleanup complete. Removed \(deletedCount) secrets using individual deletion.")
-            print("Nuclear cleanup also performed to ensure all easykey items are removed.")
+            if json {
+                let data = try JSONSerialization.data(withJSONObject: ["removed": deletedCount])
+                FileHandle.standardOutput.write(data)
+                FileHandle.standardOutput.write("\n".data(using: .utf8)!)
+            } else {
+                print("Cleanup complete. Removed \(deletedCount) secrets using individual deletion.")
+                print("Nuclear cleanup also performed to ensure all easykey items are removed.")
+            }
             if options.verbose { eprint("[debug] cleanup: success") }
         } else {
             print("Cleanup cancelled.")
         }
+    case .server:
+        if options.verbose { eprint("[debug] stdio server started") }
+        runStdioServer(kc: kc, options: options)
+        if options.verbose { eprint("[debug] stdio server stopped") }
     case .uninstall:
         if options.verbose { eprint("[debug] uninstall") }
         let appPath = "/Applications/EasyKey.app"
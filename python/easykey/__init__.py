@@ -4,11 +4,34 @@ EasyKey Python Package
 A simple Python wrapper for the easykey CLI that provides secure keychain access.
 """
 
+import asyncio
+import atexit
 import subprocess
 import json
 import os
 import shutil
-from typing import Optional, List, Dict, Any
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Optional, List, Dict, Any, Generator, Iterator, Sequence, Tuple, Union, cast
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when installed, falling back to the stdlib.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the latter either way.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class EasyKeyError(Exception):
@@ -16,11 +39,63 @@ class EasyKeyError(Exception):
     pass
 
 
+# Resolved path of the easykey binary, cached after the first successful lookup
+_BINARY_PATH: Optional[str] = None
+
+# Per-command argv prefixes (binary path, command), built on first use
+_ARGV_PREFIXES: Dict[str, Tuple[str, ...]] = {}
+
+
+def _invalidate_binary_cache() -> None:
+    """
+    Forget the cached binary path so the next lookup searches again.
+    
+    The stdio server started from the old binary is stopped too, so the
+    next request starts a new one from the freshly resolved binary.
+    """
+    global _BINARY_PATH
+    _BINARY_PATH = None
+    _ARGV_PREFIXES.clear()
+    _daemon.reset()
+
+
+def _is_executable_file(path: str) -> bool:
+    """Check that path is a regular file with an execute bit, using one stat call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
 def _find_easykey_binary() -> str:
-    """Find the easykey binary in common locations."""
+    """
+    Find the easykey binary.
+    
+    The EASYKEY_BINARY environment variable, if set, names the binary to use
+    (an absolute path, or a command looked up in PATH). Otherwise PATH and
+    then the common installation locations are searched.
+    """
+    global _BINARY_PATH
+    if _BINARY_PATH is not None:
+        return _BINARY_PATH
+    
+    override = os.environ.get('EASYKEY_BINARY')
+    if override:
+        # An absolute path needs no PATH scan
+        if os.path.isabs(override) and _is_executable_file(override):
+            _BINARY_PATH = override
+            return override
+        binary_path = shutil.which(override)
+        if not binary_path:
+            raise EasyKeyError(f"EASYKEY_BINARY is set to {override!r}, which is not an executable")
+        _BINARY_PATH = binary_path
+        return binary_path
+    
     # Check if it's in PATH
     binary_path = shutil.which('easykey')
     if binary_path:
+        _BINARY_PATH = binary_path
         return binary_path
     
     # Check common installation locations
@@ -33,7 +108,8 @@ def _find_easykey_binary() -> str:
     ]
     
     for path in common_paths:
-        if os.path.isfile(path) and os.access(path, os.X_OK):
+        if _is_executable_file(path):
+            _BINARY_PATH = path
             return path
     
     raise EasyKeyError(
@@ -42,28 +118,262 @@ def _find_easykey_binary() -> str:
     )
 
 
-def _run_easykey_command(args: List[str]) -> str:
-    """Run easykey command and return stdout."""
+def _argv(command: str, *args: str) -> Tuple[str, ...]:
+    """Build the full argv for an easykey command from its cached prefix."""
+    prefix = _ARGV_PREFIXES.get(command)
+    if prefix is None:
+        prefix = _ARGV_PREFIXES[command] = (_find_easykey_binary(), command)
+    return prefix + args
+
+
+def _get_argv(name: str, reason: Optional[str] = None) -> Tuple[str, ...]:
+    """Build the argv for a one-shot ``easykey get`` of a single secret."""
+    argv = _argv('get', name, '--quiet')
+    if reason:
+        argv += ('--reason', reason)
+    return argv
+
+
+def _decode_stdout(output: bytes) -> str:
+    """Decode raw CLI stdout as UTF-8, dropping the trailing newline."""
+    if output.endswith(b'\n'):
+        output = output[:-1]
+    return output.decode('utf-8')
+
+
+def _run_easykey_command(argv: Sequence[str], binary: bool = False) -> str:
+    """
+    Run easykey command and return stdout.
+    
+    argv is the full command line, binary path included (see _argv).
+    
+    With binary=True, stdout is read as bytes and decoded once as UTF-8,
+    skipping the text-mode decoder; used on the hot secret retrieval path.
+    Only the single trailing newline the CLI prints is removed.
+    """
     try:
-        binary_path = _find_easykey_binary()
+        if binary:
+            raw = subprocess.run(
+                argv,
+                capture_output=True,
+                check=True
+            )
+            return _decode_stdout(raw.stdout)
         result = subprocess.run(
-            [binary_path] + args,
+            argv,
             capture_output=True,
             text=True,
             check=True
         )
-        return result.stdout.strip()
+        output = result.stdout
+        if output.endswith('\n'):
+            output = output[:-1]
+        return output
     except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
+        stderr = e.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode('utf-8', 'replace')
+        error_msg = stderr.strip() if stderr else str(e)
         raise EasyKeyError(f"easykey command failed: {error_msg}")
     except FileNotFoundError as e:
         raise EasyKeyError(f"easykey binary not found: {e}")
+    except UnicodeDecodeError as e:
+        raise EasyKeyError(f"Failed to decode easykey output: {e}")
+
+
+def _is_batch_unsupported(error: EasyKeyError) -> bool:
+    """Tell whether error came from an older CLI that read --batch as a secret name."""
+    return 'Secret not found: --batch' in str(error)
+
+
+def _stream_easykey_command(
+    argv: Sequence[str], stdin: Optional[IO[str]] = None
+) -> Generator[str, None, None]:
+    """
+    Run easykey command and yield non-empty stdout lines as they arrive.
+    
+    If stdin is given (typically another process's stdout pipe), it is handed
+    to the child and closed in this process so the writer sees a broken pipe
+    if the child exits early.
+    """
+    try:
+        process = subprocess.Popen(
+            argv,
+            stdin=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except FileNotFoundError as e:
+        raise EasyKeyError(f"easykey binary not found: {e}")
+    finally:
+        if stdin is not None:
+            stdin.close()
+    
+    stdout, stderr = process.stdout, process.stderr
+    assert stdout is not None and stderr is not None
+    with process:
+        for line in stdout:
+            line = line.rstrip('\n')
+            if line:
+                yield line
+        error_output = stderr.read()
+        if process.wait() != 0:
+            error_msg = error_output.strip() or f"exit status {process.returncode}"
+            raise EasyKeyError(f"easykey command failed: {error_msg}")
+
+
+class _DaemonUnavailable(Exception):
+    """Raised when the stdio server cannot serve a request; callers fall back."""
+    pass
+
+
+class _Daemon:
+    """
+    A long-lived ``easykey --stdio-server`` process shared by all calls.
+    
+    Requests and replies are newline-delimited JSON. The server is opt-in
+    (see enable_stdio_server). If the installed CLI does not support the
+    server mode, the daemon disables itself and callers fall back to one-shot
+    invocations.
+    """
+    
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._pipes: Optional[Tuple[IO[str], IO[str]]] = None
+        self._enabled = False
+        self._available = True
+        self._lock = threading.Lock()
+    
+    def _start(self) -> Tuple[IO[str], IO[str]]:
+        process = subprocess.Popen(
+            [_find_easykey_binary(), '--stdio-server'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        assert process.stdin is not None and process.stdout is not None
+        self._process = process
+        self._pipes = (process.stdin, process.stdout)
+        return self._pipes
+    
+    def request(self, payload: Dict[str, Any]) -> Any:
+        """Send one request and return its result."""
+        with self._lock:
+            if not (self._enabled and self._available):
+                raise _DaemonUnavailable()
+            
+            started = self._pipes is None
+            try:
+                stdin, stdout = self._pipes or self._start()
+                stdin.write(json.dumps(payload) + '\n')
+                stdin.flush()
+                line = stdout.readline()
+            except OSError:
+                line = ''
+            
+            if not line:
+                # A server that dies on its first request does not exist in
+                # this CLI version; one that dies later is restarted next time.
+                self._close_locked()
+                if started:
+                    self._available = False
+                raise _DaemonUnavailable()
+        
+        try:
+            reply = _json_loads(line)
+        except json.JSONDecodeError as e:
+            raise EasyKeyError(f"Failed to parse easykey output: {e}")
+        if not reply.get('ok'):
+            raise EasyKeyError(f"easykey command failed: {reply.get('error')}")
+        return reply.get('result')
+    
+    def set_enabled(self, enabled: bool) -> None:
+        """Turn the server on or off; turning it off stops the process."""
+        with self._lock:
+            self._enabled = enabled
+            self._available = True
+            if not enabled:
+                self._close_locked()
+    
+    def close(self) -> None:
+        """Stop the server process, if running."""
+        with self._lock:
+            self._close_locked()
+    
+    def reset(self) -> None:
+        """Stop the server process and allow a new one to be started."""
+        with self._lock:
+            self._close_locked()
+            self._available = True
+    
+    def _after_fork_in_child(self) -> None:
+        # The inherited process and pipes belong to the parent; sharing them
+        # would interleave both processes' requests and replies. Drop them
+        # without closing, so the child starts its own server on next use.
+        self._lock = threading.Lock()
+        self._process = None
+        self._pipes = None
+    
+    def _close_locked(self) -> None:
+        process, pipes = self._process, self._pipes
+        self._process = self._pipes = None
+        if process is None or pipes is None:
+            return
+        stdin, stdout = pipes
+        try:
+            stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            stdout.close()
+
+
+_daemon = _Daemon()
+atexit.register(_daemon.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_daemon._after_fork_in_child)
+
+
+def _daemon_payload(op: str, reason: Optional[str], **fields: Any) -> Dict[str, Any]:
+    """Build a stdio server request, omitting the reason when not given."""
+    payload = dict(op=op, **fields)
+    if reason:
+        payload['reason'] = reason
+    return payload
+
+
+def enable_stdio_server(enabled: bool = True) -> None:
+    """
+    Route secret(), list() and status() through a shared stdio server.
+    
+    When enabled, the first request starts one long-lived
+    ``easykey --stdio-server`` process that later requests reuse, instead of
+    spawning the CLI each time. The server authenticates once and reuses
+    that authentication until the reason changes or its reuse window
+    (5 minutes) runs out, so calls in between are not individually
+    confirmed. It is therefore off by default. CLIs without server support
+    fall back to one-shot invocations.
+    
+    Args:
+        enabled: Whether to use the stdio server
+    """
+    _daemon.set_enabled(enabled)
 
 
 def secret(name: str, reason: Optional[str] = None) -> str:
     """
     Retrieve a secret from the easykey vault.
     
+    Each call runs the CLI, which asks for authentication. If the stdio
+    server has been enabled (see enable_stdio_server), the request goes to
+    it instead and is only authenticated when the server session starts,
+    when reason differs from the previous request's, or after the session's
+    reuse window expires.
+    
     Args:
         name: The name of the secret to retrieve
         reason: Optional reason for accessing the secret (for audit logging)
@@ -74,11 +384,159 @@ def secret(name: str, reason: Optional[str] = None) -> str:
     Raises:
         EasyKeyError: If the secret cannot be retrieved
     """
-    args = ['get', name, '--quiet']
+    try:
+        return cast(str, _daemon.request(_daemon_payload('get', reason, name=name)))
+    except _DaemonUnavailable:
+        pass
+    
+    return _secret_oneshot(name, reason)
+
+
+def _secret_oneshot(name: str, reason: Optional[str] = None) -> str:
+    """Retrieve a secret with a dedicated easykey invocation, bypassing the daemon."""
+    return _run_easykey_command(_get_argv(name, reason), binary=True)
+
+
+async def asecret(name: str, reason: Optional[str] = None) -> str:
+    """
+    Retrieve a secret from the easykey vault without blocking the event loop.
+    
+    Args:
+        name: The name of the secret to retrieve
+        reason: Optional reason for accessing the secret (for audit logging)
+    
+    Returns:
+        The secret value as a string
+        
+    Raises:
+        EasyKeyError: If the secret cannot be retrieved
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_get_argv(name, reason),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError as e:
+        raise EasyKeyError(f"easykey binary not found: {e}")
+    
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        # Don't leave the CLI running (and possibly prompting) behind us
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    
+    if process.returncode != 0:
+        error_msg = stderr.decode('utf-8', 'replace').strip() or f"exit status {process.returncode}"
+        raise EasyKeyError(f"easykey command failed: {error_msg}")
+    
+    try:
+        return _decode_stdout(stdout)
+    except UnicodeDecodeError as e:
+        raise EasyKeyError(f"Failed to decode easykey output: {e}")
+
+
+async def asecret_many(
+    names: List[str], reason: Optional[str] = None, max_concurrency: int = 8
+) -> Dict[str, Union[str, EasyKeyError]]:
+    """
+    Retrieve several secrets concurrently without blocking the event loop.
+    
+    The async counterpart of secret_many(): a failure to retrieve one secret
+    does not affect the others; its entry in the result holds the EasyKeyError.
+    
+    Args:
+        names: The names of the secrets to retrieve
+        reason: Optional reason for accessing the secrets (for audit logging)
+        max_concurrency: Maximum number of concurrent easykey invocations
+    
+    Returns:
+        A dictionary mapping each secret name to its value or EasyKeyError
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch(name: str) -> Union[str, EasyKeyError]:
+        async with semaphore:
+            try:
+                return await asecret(name, reason)
+            except EasyKeyError as e:
+                return e
+    
+    values = await asyncio.gather(*(fetch(name) for name in names))
+    return dict(zip(names, values))
+
+
+def get_secrets(names: List[str], reason: Optional[str] = None) -> Dict[str, str]:
+    """
+    Retrieve several secrets from the easykey vault in a single CLI invocation.
+    
+    CLIs without ``get --batch`` are handled by falling back to one
+    secret() call per name.
+    
+    Args:
+        names: The names of the secrets to retrieve
+        reason: Optional reason for accessing the secrets (for audit logging)
+    
+    Returns:
+        A dictionary mapping each secret name to its value
+        
+    Raises:
+        EasyKeyError: If any of the secrets cannot be retrieved
+    """
+    if not names:
+        return {}
+    
+    argv = _argv('get', '--batch', *names)
     if reason:
-        args.extend(['--reason', reason])
+        argv += ('--reason', reason)
+    
+    try:
+        output = _run_easykey_command(argv)
+    except EasyKeyError as e:
+        if not _is_batch_unsupported(e):
+            raise
+        return {name: secret(name, reason) for name in names}
+    
+    try:
+        return cast(Dict[str, str], _json_loads(output))
+    except json.JSONDecodeError as e:
+        raise EasyKeyError(f"Failed to parse easykey output: {e}")
+
+
+def secret_many(
+    names: List[str], reason: Optional[str] = None, max_workers: int = 8
+) -> Dict[str, Union[str, EasyKeyError]]:
+    """
+    Retrieve several secrets concurrently, one CLI invocation per secret.
     
-    return _run_easykey_command(args)
+    The stdio server handles one request at a time, so this bypasses it to
+    let the invocations run in parallel. Prefer get_secrets() when the
+    installed CLI supports batch retrieval.
+    A failure to retrieve one secret does not affect the others: its entry
+    in the result holds the EasyKeyError instead of a value.
+    
+    Args:
+        names: The names of the secrets to retrieve
+        reason: Optional reason for accessing the secrets (for audit logging)
+        max_workers: Maximum number of concurrent easykey invocations
+    
+    Returns:
+        A dictionary mapping each secret name to its value or EasyKeyError
+    """
+    def fetch(name: str) -> Union[str, EasyKeyError]:
+        try:
+            return _secret_oneshot(name, reason)
+        except EasyKeyError as e:
+            return e
+    
+    if not names:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(names, executor.map(fetch, names)))
 
 
 def list(include_timestamps: bool = False) -> List[Dict[str, Any]]:
@@ -94,20 +552,119 @@ def list(include_timestamps: bool = False) -> List[Dict[str, Any]]:
     Raises:
         EasyKeyError: If the secrets cannot be listed
     """
-    args = ['list', '--json']
+    try:
+        return cast(List[Dict[str, Any]], _daemon.request(_daemon_payload('list', None)))
+    except _DaemonUnavailable:
+        pass
+    
+    argv = _argv('list', '--json')
     if include_timestamps:
-        args.append('--verbose')
+        argv += ('--verbose',)
     
-    output = _run_easykey_command(args)
+    output = _run_easykey_command(argv)
     if not output:
         return []
     
     try:
-        return json.loads(output)
+        return cast(List[Dict[str, Any]], _json_loads(output))
     except json.JSONDecodeError as e:
         raise EasyKeyError(f"Failed to parse easykey output: {e}")
 
 
+def iter_secrets(include_timestamps: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the secrets in the easykey vault as the CLI reports them.
+    
+    Unlike list(), entries are parsed one line at a time from
+    ``easykey list --jsonl``, so memory use does not grow with the vault.
+    Older CLIs ignore --jsonl and print plain names; in that case this
+    falls back to list().
+    
+    Args:
+        include_timestamps: Whether to include creation timestamps
+        
+    Yields:
+        A dictionary containing information about one secret
+        
+    Raises:
+        EasyKeyError: If the secrets cannot be listed
+    """
+    argv = _argv('list', '--jsonl')
+    if include_timestamps:
+        argv += ('--verbose',)
+    
+    lines = _stream_easykey_command(argv)
+    for line in lines:
+        if not line.startswith('{'):
+            lines.close()
+            yield from list(include_timestamps)
+            return
+        try:
+            yield _json_loads(line)
+        except json.JSONDecodeError as e:
+            raise EasyKeyError(f"Failed to parse easykey output: {e}")
+
+
+def iter_all_secrets(reason: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Iterate over every secret in the easykey vault together with its value.
+    
+    ``easykey list`` is piped straight into ``easykey get --batch --stdin``,
+    so the whole vault is read with two processes instead of one per secret.
+    CLIs without ``get --batch`` are handled by falling back to list() and
+    one secret() call per name.
+    
+    Args:
+        reason: Optional reason for accessing the secrets (for audit logging)
+        
+    Yields:
+        (name, value) tuples, one per secret
+        
+    Raises:
+        EasyKeyError: If the secrets cannot be listed or retrieved
+    """
+    list_argv = _argv('list')
+    get_argv = _argv('get', '--batch', '--stdin')
+    if reason:
+        list_argv += ('--reason', reason)
+        get_argv += ('--reason', reason)
+    
+    try:
+        lister = subprocess.Popen(
+            list_argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except FileNotFoundError as e:
+        raise EasyKeyError(f"easykey binary not found: {e}")
+    
+    lister_stdout, lister_stderr = lister.stdout, lister.stderr
+    assert lister_stdout is not None and lister_stderr is not None
+    batch_unsupported = False
+    with lister:
+        try:
+            for line in _stream_easykey_command(get_argv, stdin=lister_stdout):
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError as e:
+                    raise EasyKeyError(f"Failed to parse easykey output: {e}")
+                yield entry['name'], entry['value']
+        except EasyKeyError as e:
+            if not _is_batch_unsupported(e):
+                raise
+            batch_unsupported = True
+        else:
+            stderr = lister_stderr.read()
+            if lister.wait() != 0:
+                error_msg = stderr.strip() or f"exit status {lister.returncode}"
+                raise EasyKeyError(f"easykey command failed: {error_msg}")
+    
+    if batch_unsupported:
+        for entry in list():
+            yield entry['name'], secret(entry['name'], reason)
+
+
 def status() -> Dict[str, Any]:
     """
     Get the status of the easykey vault.
@@ -118,12 +675,32 @@ def status() -> Dict[str, Any]:
     Raises:
         EasyKeyError: If the status cannot be retrieved
     """
-    output = _run_easykey_command(['status'])
+    result: Optional[Dict[str, Any]]
+    try:
+        result = _daemon.request(_daemon_payload('status', None))
+    except _DaemonUnavailable:
+        result = None
+    
+    if result is None:
+        output = _run_easykey_command(_argv('status', '--json'))
+        if not output.startswith('{'):
+            return _parse_legacy_status(output)
+        try:
+            result = cast(Dict[str, Any], _json_loads(output))
+        except json.JSONDecodeError as e:
+            raise EasyKeyError(f"Failed to parse easykey output: {e}")
     
+    if 'secrets' in result:
+        result['secrets'] = int(result['secrets'])
+    return result
+
+
+def _parse_legacy_status(output: str) -> Dict[str, Any]:
+    """Parse the line format printed by CLIs that ignore ``status --json``."""
     # Parse the output format:
     # secrets: 5
     # last_access: 2023-08-27T15:30:45.123Z
-    result = {}
+    result: Dict[str, Any] = {}
     for line in output.split('\n'):
         if ':' in line:
             key, value = line.split(':', 1)
@@ -148,7 +725,14 @@ __version__ = "0.1.0"
 __all__ = [
     'secret',
     'get_secret', 
+    'get_secrets',
+    'secret_many',
+    'enable_stdio_server',
+    'asecret',
+    'asecret_many',
     'list',
+    'iter_secrets',
+    'iter_all_secrets',
     'status',
     'EasyKeyError'
 ]
@@ -42,8 +42,11 @@ setup(
         # No external dependencies - uses only stdlib
     ],
     extras_require={
+        "fast": [
+            "orjson",
+        ],
         "dev": [
-            "pytest>=6.0",
+            "pytest>=7.0",
             "pytest-cov",
             "black",
             "flake8",
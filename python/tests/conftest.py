@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+
+import pytest
+
+import easykey
+
+
+SECRETS = {'API_KEY': 'sk-123', 'DB_PASSWORD': 'hunter2'}
+
+
+class FakeCLI:
+    """Handle on the fake easykey binary installed for one test."""
+
+    def __init__(self, monkeypatch, binary, log_path):
+        self._monkeypatch = monkeypatch
+        self.binary = binary
+        self.log_path = log_path
+
+    def set(self, name, value='1'):
+        """Set a FAKE_EASYKEY_* option (see fake_easykey.py)."""
+        if not isinstance(value, str):
+            value = json.dumps(value)
+        self._monkeypatch.setenv(f'FAKE_EASYKEY_{name}', value)
+
+    def invocations(self):
+        """Return the argument lines of every CLI invocation so far."""
+        if not os.path.exists(self.log_path):
+            return []
+        with open(self.log_path) as f:
+            return f.read().splitlines()
+
+    def server_starts(self):
+        """Return the invocations that started a stdio server."""
+        return [line for line in self.invocations() if line == '--stdio-server']
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """Put a fake easykey binary first on PATH for the duration of a test."""
+    script = os.path.join(os.path.dirname(__file__), 'fake_easykey.py')
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    binary = bin_dir / 'easykey'
+    binary.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+    binary.chmod(0o755)
+
+    log_path = str(tmp_path / 'invocations.log')
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv('FAKE_EASYKEY_LOG', log_path)
+    monkeypatch.setenv('FAKE_EASYKEY_SECRETS', json.dumps(SECRETS))
+    easykey._invalidate_binary_cache()
+
+    yield FakeCLI(monkeypatch, str(binary), log_path)
+
+    easykey.enable_stdio_server(False)
+    easykey._invalidate_binary_cache()
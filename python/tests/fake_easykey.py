@@ -0,0 +1,132 @@
+"""
+Stand-in for the easykey CLI used by the test suite.
+
+Behaviour is driven by environment variables so that each test can shape it
+through monkeypatch:
+
+    FAKE_EASYKEY_SECRETS      JSON object of secret name -> value
+    FAKE_EASYKEY_STATUS       JSON object printed by ``status``
+    FAKE_EASYKEY_OLD          act like a CLI that predates the flags added
+                              alongside the Python package's batch features
+    FAKE_EASYKEY_NO_SERVER    reject --stdio-server but support everything else
+    FAKE_EASYKEY_DIE_AFTER    make the stdio server exit after N replies
+    FAKE_EASYKEY_FAIL_LIST    make ``list`` exit with an error
+    FAKE_EASYKEY_LIST_EXTRA   name that ``list`` reports but ``get`` cannot find
+    FAKE_EASYKEY_SLEEP        seconds to wait before answering ``get``
+    FAKE_EASYKEY_PIDFILE      file that receives the process id
+    FAKE_EASYKEY_LOG          file that receives one line per invocation
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def fail(message):
+    print(f"error: {message}", file=sys.stderr)
+    sys.exit(1)
+
+
+def main():
+    secrets = json.loads(os.environ.get('FAKE_EASYKEY_SECRETS', '{}'))
+    state = json.loads(os.environ.get('FAKE_EASYKEY_STATUS', '{"secrets": 0, "last_access": null}'))
+    old = 'FAKE_EASYKEY_OLD' in os.environ
+
+    log = os.environ.get('FAKE_EASYKEY_LOG')
+    if log:
+        with open(log, 'a') as f:
+            f.write(' '.join(sys.argv[1:]) + '\n')
+    pidfile = os.environ.get('FAKE_EASYKEY_PIDFILE')
+    if pidfile:
+        with open(pidfile, 'w') as f:
+            f.write(str(os.getpid()))
+
+    # Mirror the CLI's order-agnostic flag extraction
+    args = sys.argv[1:]
+    flags = set()
+    known = {'--verbose', '--json', '--quiet'}
+    if not old:
+        known |= {'--jsonl', '--batch', '--stdin', '--stdio-server'}
+    i = 0
+    while i < len(args):
+        if args[i] == '--reason':
+            del args[i:i + 2]
+        elif args[i] in known:
+            flags.add(args.pop(i))
+        else:
+            i += 1
+
+    if '--stdio-server' in flags:
+        if 'FAKE_EASYKEY_NO_SERVER' in os.environ:
+            fail("Unknown command: --stdio-server")
+        serve(secrets, state, int(os.environ.get('FAKE_EASYKEY_DIE_AFTER', '0')))
+        return
+    if not args:
+        fail("Missing command. Use --help for usage.")
+
+    command = args[0]
+    if command == 'get':
+        time.sleep(float(os.environ.get('FAKE_EASYKEY_SLEEP', '0')))
+        if '--batch' in flags and '--stdin' in flags:
+            for name in sys.stdin:
+                name = name.strip()
+                if name not in secrets:
+                    fail(f"Secret not found: {name}")
+                print(json.dumps({'name': name, 'value': secrets[name]}), flush=True)
+        elif '--batch' in flags:
+            missing = [name for name in args[1:] if name not in secrets]
+            if missing:
+                fail(f"Secret not found: {missing[0]}")
+            print(json.dumps({name: secrets[name] for name in args[1:]}))
+        elif args[1] in secrets:
+            # surrogateescape lets a test plant bytes that are not valid UTF-8
+            sys.stdout.buffer.write(secrets[args[1]].encode('utf-8', 'surrogateescape') + b'\n')
+        else:
+            fail(f"Secret not found: {args[1]}")
+    elif command == 'list':
+        if 'FAKE_EASYKEY_FAIL_LIST' in os.environ:
+            fail("List failed (-25300)")
+        if 'FAKE_EASYKEY_LIST_EXTRA' in os.environ:
+            secrets[os.environ['FAKE_EASYKEY_LIST_EXTRA']] = None
+        if '--jsonl' in flags:
+            for name in secrets:
+                print(json.dumps({'name': name}))
+        elif '--json' in flags:
+            print(json.dumps([{'name': name} for name in secrets], indent=2))
+        else:
+            for name in secrets:
+                print(name)
+    elif command == 'status':
+        if '--json' in flags and not old:
+            print(json.dumps(state))
+        else:
+            for key, value in state.items():
+                print(f"{key}: {'-' if value is None else value}")
+    else:
+        fail(f"Unknown command: {command}")
+
+
+def serve(secrets, state, die_after):
+    replies = 0
+    for line in sys.stdin:
+        request = json.loads(line)
+        op = request['op']
+        if op == 'get' and request['name'] in secrets:
+            reply = {'ok': True, 'result': secrets[request['name']]}
+        elif op == 'get':
+            reply = {'ok': False, 'error': f"Secret not found: {request['name']}"}
+        elif op == 'list':
+            reply = {'ok': True, 'result': [{'name': name} for name in secrets]}
+        elif op == 'status':
+            reply = {'ok': True, 'result': state}
+        else:
+            reply = {'ok': False, 'error': f"Unknown op: {op}"}
+        print(json.dumps(reply), flush=True)
+        replies += 1
+        if replies == die_after:
+            return
+
+
+if __name__ == '__main__':
+    main()
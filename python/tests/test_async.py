@@ -0,0 +1,47 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+import easykey
+
+
+def test_asecret(fake_cli):
+    assert asyncio.run(easykey.asecret('API_KEY', 'Testing')) == 'sk-123'
+    assert fake_cli.invocations() == ['get API_KEY --quiet --reason Testing']
+
+
+def test_asecret_missing_raises(fake_cli):
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: MISSING'):
+        asyncio.run(easykey.asecret('MISSING'))
+
+
+def test_asecret_many_isolates_errors(fake_cli):
+    results = asyncio.run(easykey.asecret_many(['API_KEY', 'MISSING', 'DB_PASSWORD']))
+
+    assert results['API_KEY'] == 'sk-123'
+    assert results['DB_PASSWORD'] == 'hunter2'
+    assert isinstance(results['MISSING'], easykey.EasyKeyError)
+
+
+def test_asecret_cancelled_kills_cli(fake_cli, tmp_path):
+    pidfile = tmp_path / 'easykey.pid'
+    fake_cli.set('SLEEP', '30')
+    fake_cli.set('PIDFILE', str(pidfile))
+
+    async def fetch_with_timeout():
+        task = asyncio.ensure_future(easykey.asecret('API_KEY'))
+        while not pidfile.exists():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    started = time.monotonic()
+    asyncio.run(fetch_with_timeout())
+
+    assert time.monotonic() - started < 10
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pidfile.read_text()), 0)
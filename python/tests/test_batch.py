@@ -0,0 +1,54 @@
+import pytest
+
+import easykey
+
+
+def test_get_secrets_uses_one_invocation(fake_cli):
+    assert easykey.get_secrets(['API_KEY', 'DB_PASSWORD'], 'Testing') == {
+        'API_KEY': 'sk-123',
+        'DB_PASSWORD': 'hunter2',
+    }
+    assert fake_cli.invocations() == ['get --batch API_KEY DB_PASSWORD --reason Testing']
+
+
+def test_get_secrets_empty(fake_cli):
+    assert easykey.get_secrets([]) == {}
+    assert fake_cli.invocations() == []
+
+
+def test_get_secrets_raises_for_missing_secret(fake_cli):
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: MISSING'):
+        easykey.get_secrets(['API_KEY', 'MISSING'])
+
+
+def test_get_secrets_falls_back_on_old_cli(fake_cli):
+    fake_cli.set('OLD')
+
+    assert easykey.get_secrets(['API_KEY', 'DB_PASSWORD']) == {
+        'API_KEY': 'sk-123',
+        'DB_PASSWORD': 'hunter2',
+    }
+    assert fake_cli.invocations()[1:] == [
+        'get API_KEY --quiet',
+        'get DB_PASSWORD --quiet',
+    ]
+
+
+def test_get_secrets_fallback_still_reports_missing_secret(fake_cli):
+    fake_cli.set('OLD')
+
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: MISSING'):
+        easykey.get_secrets(['API_KEY', 'MISSING'])
+
+
+def test_secret_many_isolates_errors(fake_cli):
+    results = easykey.secret_many(['API_KEY', 'MISSING', 'DB_PASSWORD'])
+
+    assert results['API_KEY'] == 'sk-123'
+    assert results['DB_PASSWORD'] == 'hunter2'
+    assert isinstance(results['MISSING'], easykey.EasyKeyError)
+    assert 'Secret not found: MISSING' in str(results['MISSING'])
+
+
+def test_secret_many_empty(fake_cli):
+    assert easykey.secret_many([]) == {}
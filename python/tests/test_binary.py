@@ -0,0 +1,98 @@
+import shutil
+
+import pytest
+
+import easykey
+
+
+def test_binary_path_is_cached(fake_cli, monkeypatch):
+    calls = []
+    real_which = shutil.which
+
+    def counting_which(*args, **kwargs):
+        calls.append(args)
+        return real_which(*args, **kwargs)
+
+    monkeypatch.setattr(shutil, 'which', counting_which)
+
+    assert easykey._find_easykey_binary() == fake_cli.binary
+    assert easykey._find_easykey_binary() == fake_cli.binary
+    assert len(calls) == 1
+
+
+def test_invalidate_binary_cache_searches_again(fake_cli, monkeypatch):
+    easykey._find_easykey_binary()
+    easykey._invalidate_binary_cache()
+    monkeypatch.setattr(shutil, 'which', lambda *args, **kwargs: '/somewhere/else/easykey')
+
+    assert easykey._find_easykey_binary() == '/somewhere/else/easykey'
+
+
+def test_secret_uses_cached_binary(fake_cli):
+    assert easykey.secret('API_KEY') == 'sk-123'
+    assert easykey.secret('DB_PASSWORD', 'Testing') == 'hunter2'
+    assert fake_cli.invocations() == [
+        'get API_KEY --quiet',
+        'get DB_PASSWORD --quiet --reason Testing',
+    ]
+
+
+def test_easykey_binary_absolute_path_skips_path_scan(fake_cli, monkeypatch):
+    monkeypatch.setenv('EASYKEY_BINARY', fake_cli.binary)
+    monkeypatch.setattr(shutil, 'which', lambda *args, **kwargs: None)
+
+    assert easykey._find_easykey_binary() == fake_cli.binary
+
+
+def test_easykey_binary_relative_name_is_looked_up_in_path(fake_cli, monkeypatch, tmp_path):
+    renamed = tmp_path / 'bin' / 'easykey-dev'
+    renamed.write_text(open(fake_cli.binary).read())
+    renamed.chmod(0o755)
+    monkeypatch.setenv('EASYKEY_BINARY', 'easykey-dev')
+
+    assert easykey._find_easykey_binary() == str(renamed)
+    assert easykey.secret('API_KEY') == 'sk-123'
+
+
+def test_easykey_binary_not_executable_raises(fake_cli, monkeypatch, tmp_path):
+    plain = tmp_path / 'easykey-plain'
+    plain.write_text('')
+    plain.chmod(0o644)
+    monkeypatch.setenv('EASYKEY_BINARY', str(plain))
+
+    with pytest.raises(easykey.EasyKeyError, match='EASYKEY_BINARY is set to'):
+        easykey._find_easykey_binary()
+
+
+def test_easykey_binary_missing_raises(fake_cli, monkeypatch):
+    monkeypatch.setenv('EASYKEY_BINARY', 'no-such-easykey')
+
+    with pytest.raises(easykey.EasyKeyError, match="EASYKEY_BINARY is set to 'no-such-easykey'"):
+        easykey._find_easykey_binary()
+
+
+def test_argv_prefix_is_cached_and_invalidated(fake_cli):
+    assert easykey._argv('get', 'API_KEY') == (fake_cli.binary, 'get', 'API_KEY')
+    assert easykey._ARGV_PREFIXES == {'get': (fake_cli.binary, 'get')}
+
+    easykey._invalidate_binary_cache()
+
+    assert easykey._ARGV_PREFIXES == {}
+
+
+def test_is_executable_file(fake_cli, tmp_path):
+    plain = tmp_path / 'plain'
+    plain.write_text('')
+    plain.chmod(0o644)
+
+    assert easykey._is_executable_file(fake_cli.binary)
+    assert not easykey._is_executable_file(str(plain))
+    assert not easykey._is_executable_file(str(tmp_path))
+    assert not easykey._is_executable_file(str(tmp_path / 'missing'))
+
+
+def test_easykey_binary_directory_raises(fake_cli, monkeypatch, tmp_path):
+    monkeypatch.setenv('EASYKEY_BINARY', str(tmp_path))
+
+    with pytest.raises(easykey.EasyKeyError, match='EASYKEY_BINARY is set to'):
+        easykey._find_easykey_binary()
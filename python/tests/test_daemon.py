@@ -0,0 +1,124 @@
+import os
+
+import pytest
+
+import easykey
+
+
+@pytest.fixture
+def server(fake_cli):
+    easykey.enable_stdio_server()
+    return fake_cli
+
+
+def test_server_is_off_by_default(fake_cli):
+    assert easykey.secret('API_KEY') == 'sk-123'
+
+    assert fake_cli.invocations() == ['get API_KEY --quiet']
+    assert easykey._daemon._process is None
+
+
+def test_requests_share_one_server(server):
+    assert easykey.secret('API_KEY') == 'sk-123'
+    assert easykey.secret('DB_PASSWORD') == 'hunter2'
+    assert easykey.list() == [{'name': 'API_KEY'}, {'name': 'DB_PASSWORD'}]
+
+    assert server.invocations() == ['--stdio-server']
+
+
+def test_server_error_reply_raises(server):
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: MISSING'):
+        easykey.secret('MISSING')
+
+
+def test_old_cli_falls_back_to_one_shot(server):
+    server.set('OLD')
+
+    assert easykey.secret('API_KEY') == 'sk-123'
+    assert easykey.secret('DB_PASSWORD') == 'hunter2'
+
+    assert not easykey._daemon._available
+    # The server is only tried once; later calls go straight to one-shot
+    assert len(server.server_starts()) == 1
+    assert server.invocations()[1:] == [
+        'get API_KEY --quiet',
+        'get DB_PASSWORD --quiet',
+    ]
+
+
+def test_server_dying_mid_session_is_restarted(server):
+    server.set('DIE_AFTER', '1')
+
+    assert easykey.secret('API_KEY') == 'sk-123'
+    # The server exits before answering this one; it is served one-shot
+    assert easykey.secret('DB_PASSWORD') == 'hunter2'
+    assert easykey._daemon._available
+    # ...and the next request starts a fresh server
+    assert easykey.secret('API_KEY') == 'sk-123'
+
+    assert server.invocations() == [
+        '--stdio-server',
+        'get DB_PASSWORD --quiet',
+        '--stdio-server',
+    ]
+
+
+def test_invalidating_binary_cache_stops_server(server):
+    easykey.secret('API_KEY')
+    process = easykey._daemon._process
+    assert process is not None
+
+    easykey._invalidate_binary_cache()
+
+    assert easykey._daemon._process is None
+    assert process.poll() is not None
+
+
+def test_disabling_stops_server(server):
+    easykey.secret('API_KEY')
+    process = easykey._daemon._process
+    assert process is not None
+
+    easykey.enable_stdio_server(False)
+
+    assert process.poll() is not None
+    assert easykey.secret('API_KEY') == 'sk-123'
+    assert server.invocations() == ['--stdio-server', 'get API_KEY --quiet']
+
+
+def test_secret_many_bypasses_server(server):
+    assert easykey.secret_many(['API_KEY', 'DB_PASSWORD']) == {
+        'API_KEY': 'sk-123',
+        'DB_PASSWORD': 'hunter2',
+    }
+
+    assert server.server_starts() == []
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_child_starts_its_own_server(server):
+    easykey.secret('API_KEY')
+    parent_process = easykey._daemon._process
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_end)
+            inherited = easykey._daemon._process
+            value = easykey.secret('DB_PASSWORD')
+            ok = inherited is None and easykey._daemon._process is not parent_process
+            os.write(write_end, f"{ok} {value}".encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as f:
+        report = f.read()
+    os.waitpid(pid, 0)
+
+    assert report == 'True hunter2'
+    assert len(server.server_starts()) == 2
+    # The parent's server is untouched by the child
+    assert parent_process.poll() is None
+    assert easykey.secret('API_KEY') == 'sk-123'
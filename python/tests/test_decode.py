@@ -0,0 +1,39 @@
+import pytest
+
+import easykey
+
+
+def test_secret_decodes_utf8(fake_cli):
+    fake_cli.set('SECRETS', {'GREETING': 'héllo wörld ✓'})
+
+    assert easykey.secret('GREETING') == 'héllo wörld ✓'
+
+
+def test_secret_with_invalid_utf8_raises(fake_cli):
+    fake_cli.set('SECRETS', {'BROKEN': 'ok\udcff'})
+
+    with pytest.raises(easykey.EasyKeyError, match='Failed to decode easykey output'):
+        easykey.secret('BROKEN')
+
+
+def test_secret_failure_reports_stderr(fake_cli):
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: MISSING'):
+        easykey.secret('MISSING')
+
+
+def test_secret_keeps_surrounding_whitespace(fake_cli):
+    fake_cli.set('SECRETS', {'PADDED': '  padded  '})
+
+    assert easykey.secret('PADDED') == '  padded  '
+
+
+def test_secret_trims_only_the_cli_newline(fake_cli):
+    fake_cli.set('SECRETS', {'CERT': 'line one\nline two\n'})
+
+    assert easykey.secret('CERT') == 'line one\nline two\n'
+
+
+def test_list_trims_only_the_cli_newline(fake_cli):
+    fake_cli.set('SECRETS', {' spaced ': 'x'})
+
+    assert easykey._run_easykey_command(easykey._argv('list')) == ' spaced '
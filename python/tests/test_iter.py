@@ -0,0 +1,68 @@
+import pytest
+
+import easykey
+
+
+def test_iter_secrets(fake_cli):
+    assert list(easykey.iter_secrets()) == [{'name': 'API_KEY'}, {'name': 'DB_PASSWORD'}]
+    assert fake_cli.invocations() == ['list --jsonl']
+
+
+def test_iter_secrets_falls_back_on_old_cli(fake_cli):
+    fake_cli.set('OLD')
+
+    assert list(easykey.iter_secrets()) == [{'name': 'API_KEY'}, {'name': 'DB_PASSWORD'}]
+    assert fake_cli.invocations() == ['list --jsonl', 'list --json']
+
+
+def test_json_loads_uses_stdlib_without_orjson(monkeypatch):
+    monkeypatch.setattr(easykey, '_HAS_ORJSON', False)
+
+    assert easykey._json_loads('{"name": "API_KEY"}') == {'name': 'API_KEY'}
+
+
+def test_iter_all_secrets(fake_cli):
+    assert dict(easykey.iter_all_secrets('Testing')) == {
+        'API_KEY': 'sk-123',
+        'DB_PASSWORD': 'hunter2',
+    }
+    assert sorted(fake_cli.invocations()) == [
+        'get --batch --stdin --reason Testing',
+        'list --reason Testing',
+    ]
+
+
+def test_iter_all_secrets_falls_back_on_old_cli(fake_cli):
+    fake_cli.set('OLD')
+
+    assert dict(easykey.iter_all_secrets('Testing')) == {
+        'API_KEY': 'sk-123',
+        'DB_PASSWORD': 'hunter2',
+    }
+    assert fake_cli.invocations()[-3:] == [
+        'list --json',
+        'get API_KEY --quiet --reason Testing',
+        'get DB_PASSWORD --quiet --reason Testing',
+    ]
+
+
+def test_iter_all_secrets_raises_when_getter_fails(fake_cli):
+    fake_cli.set('LIST_EXTRA', 'GHOST')
+
+    with pytest.raises(easykey.EasyKeyError, match='Secret not found: GHOST'):
+        list(easykey.iter_all_secrets())
+
+
+def test_iter_all_secrets_raises_when_lister_fails(fake_cli):
+    fake_cli.set('FAIL_LIST')
+
+    with pytest.raises(easykey.EasyKeyError, match='List failed'):
+        list(easykey.iter_all_secrets())
+
+
+@pytest.mark.filterwarnings('error')
+def test_iter_all_secrets_closes_cleanly_when_abandoned(fake_cli):
+    secrets = easykey.iter_all_secrets()
+    assert next(secrets) == ('API_KEY', 'sk-123')
+
+    secrets.close()
@@ -0,0 +1,37 @@
+import easykey
+
+
+def test_status_from_server(fake_cli):
+    easykey.enable_stdio_server()
+    fake_cli.set('STATUS', {'secrets': '3', 'last_access': '2023-08-27T15:30:45.123Z'})
+
+    assert easykey.status() == {'secrets': 3, 'last_access': '2023-08-27T15:30:45.123Z'}
+    assert fake_cli.invocations() == ['--stdio-server']
+
+
+def test_status_json(fake_cli):
+    fake_cli.set('STATUS', {'secrets': 2, 'last_access': None})
+
+    assert easykey.status() == {'secrets': 2, 'last_access': None}
+    assert fake_cli.invocations() == ['status --json']
+
+
+def test_status_legacy_lines(fake_cli):
+    fake_cli.set('OLD')
+    fake_cli.set('STATUS', {'secrets': 5, 'last_access': None})
+
+    assert easykey.status() == {'secrets': 5, 'last_access': None}
+
+
+def test_status_does_not_invent_secret_count(fake_cli):
+    fake_cli.set('STATUS', {'last_access': None})
+
+    easykey.enable_stdio_server()
+    assert easykey.status() == {'last_access': None}
+
+    easykey.enable_stdio_server(False)
+    assert easykey.status() == {'last_access': None}
+
+    fake_cli.set('OLD')
+    assert easykey.status() == {'last_access': None}
+    assert fake_cli.invocations() == ['--stdio-server', 'status --json', 'status --json']